@@ -113,6 +113,7 @@ class BaseComposer(ABC):
         self.height_pt = to_pt(layout.page.height, self.units)
         self.margin_pt = to_pt(layout.page.margin, self.units)
         self._panels = panels
+        self._source_cache: dict[str, SourceInfo] | None = None
 
     @abstractmethod
     def compose(self, output_path: Path) -> None:
@@ -138,17 +139,43 @@ class BaseComposer(ABC):
         Raises:
             FigQuiltError: If the file cannot be opened
         """
-        return open_panel_source(panel)
+        if self._source_cache is None:
+            return open_panel_source(panel)
+
+        key = str(panel.file)
+        source_info = self._source_cache.get(key)
+        if source_info is None:
+            source_info = open_panel_source(panel)
+            self._source_cache[key] = source_info
+        return source_info
+
+    @contextmanager
+    def shared_panel_sources(self) -> Iterator[None]:
+        """Reuse opened source documents for panels placed within this block.
+
+        Panels referencing the same file share one fitz.Document instead
+        of re-parsing it per placement; every cached document is closed
+        when the block exits.
+        """
+        self._source_cache = {}
+        try:
+            yield
+        finally:
+            cache, self._source_cache = self._source_cache, None
+            for source_info in cache.values():
+                source_info.doc.close()
 
     @contextmanager
     def resolved_panel_source(self, panel: Panel) -> Iterator[ResolvedPanelSource]:
         """Yield an opened panel source together with its resolved geometry."""
+        shared = self._source_cache is not None
         source_info = self.open_source(panel)
         try:
             geometry = self.calculate_panel_geometry(panel, source_info.aspect_ratio)
             yield ResolvedPanelSource(source=source_info, geometry=geometry)
         finally:
-            source_info.doc.close()
+            if not shared:
+                source_info.doc.close()
 
     def calculate_content_rect(self, panel: Panel, src_aspect: float) -> ContentRect:
         """
@@ -61,8 +61,9 @@ class PDFComposer(BaseComposer):
             self._draw_background(page)
 
             panels = self.get_panels()
-            for i, panel in enumerate(panels):
-                self._place_panel(page, panel, index=i)
+            with self.shared_panel_sources():
+                for i, panel in enumerate(panels):
+                    self._place_panel(page, panel, index=i)
         except Exception:
             doc.close()
             raise
@@ -36,8 +36,9 @@ class SVGComposer(BaseComposer):
         self._draw_background(root)
 
         panels = self.get_panels()
-        for i, panel in enumerate(panels):
-            self._place_panel(root, panel, i)
+        with self.shared_panel_sources():
+            for i, panel in enumerate(panels):
+                self._place_panel(root, panel, i)
 
         tree = etree.ElementTree(root)
         with open(output_path, "wb") as f:
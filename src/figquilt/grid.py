@@ -1,5 +1,6 @@
 """Grid layout resolution: converts layout tree to flat list of positioned panels."""
 
+import functools
 import math
 from pathlib import Path
 from typing import NamedTuple
@@ -109,10 +110,13 @@ def _resolve_panel_height(panel: Panel) -> Panel:
 
 def _panel_bounds(panels: list[Panel]) -> tuple[float, float, float, float]:
     """Compute bounding box (left, top, right, bottom) for explicit panels."""
-    left = min(panel.x for panel in panels)
-    top = min(panel.y for panel in panels)
-    right = max(panel.x + panel.width for panel in panels)
-    bottom = max(panel.y + _panel_height(panel) for panel in panels)
+    left = top = math.inf
+    right = bottom = -math.inf
+    for panel in panels:
+        left = min(left, panel.x)
+        top = min(top, panel.y)
+        right = max(right, panel.x + panel.width)
+        bottom = max(bottom, panel.y + _panel_height(panel))
     return left, top, right, bottom
 
 
@@ -222,12 +226,23 @@ def _leaf_width_over_height(
     return src_w / src_h
 
 
+@functools.lru_cache(maxsize=256)
+def _source_size_cached(path_str: str, mtime_ns: int) -> tuple[float, float]:
+    """Probe a source file's size, memoized per (path, mtime) for repeat resolves."""
+    return get_image_size(Path(path_str))
+
+
 def _get_image_size_for_layout(
     panel_id: str, path: Path, *, context: str
 ) -> tuple[float, float]:
     """Resolve a panel source size and normalize loader failures to LayoutError."""
     try:
-        return get_image_size(path)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            # Let the uncached probe produce the loader's own failure message.
+            return get_image_size(path)
+        return _source_size_cached(str(path), mtime_ns)
     except ValueError as exc:
         raise LayoutError(
             f"Could not determine size of panel '{panel_id}' for {context}: {path}"
@@ -335,6 +350,19 @@ def _optimize_rows(
     uniformity_weight = 3.5 * size_uniformity
     aspect_prefix = _prefix_sums(aspects)
 
+    # Decompose log(panel_area / target_area) = c_i + 2*log(row_h), so each
+    # row's area penalty collapses to prefix sums of c and c**2 and the DP
+    # transition stays O(1) regardless of row length.
+    log_ratio_prefix: list[float] = []
+    log_ratio_sq_prefix: list[float] = []
+    if uniformity_weight > 0:
+        log_ratio = [
+            math.log(max(aspect, 1e-12)) - math.log(max(target, 1e-12))
+            for aspect, target in zip(aspects, target_area)
+        ]
+        log_ratio_prefix = _prefix_sums(log_ratio)
+        log_ratio_sq_prefix = _prefix_sums([c * c for c in log_ratio])
+
     for end in range(1, n + 1):
         for start in range(0, end):
             count = end - start
@@ -352,11 +380,10 @@ def _optimize_rows(
 
             area_penalty = 0.0
             if uniformity_weight > 0:
-                for i in range(start, end):
-                    panel_area = aspects[i] * row_h * row_h
-                    ratio = max(panel_area, 1e-12) / max(target_area[i], 1e-12)
-                    area_penalty += math.log(ratio) ** 2
-                area_penalty /= count
+                t = 2.0 * math.log(row_h)
+                sum_c = log_ratio_prefix[end] - log_ratio_prefix[start]
+                sum_c_sq = log_ratio_sq_prefix[end] - log_ratio_sq_prefix[start]
+                area_penalty = (sum_c_sq + 2.0 * t * sum_c + count * t * t) / count
 
             transition_cost = row_h_penalty + uniformity_weight * area_penalty
             cand = dp[start] + transition_cost
@@ -434,16 +461,19 @@ def _container_inner_bounds(
     return inner_x, inner_y, inner_w, inner_h
 
 
-def _resolve_linear_container(
+def _linear_child_frames(
     node: LayoutNode,
     x: float,
     y: float,
     width: float,
     height: float,
-    panels: list[Panel],
     path: tuple[str, ...],
-) -> None:
-    """Resolve a row/column container by distributing its children on one axis."""
+) -> list[tuple[LayoutNode, float, float, float, float, tuple[str, ...]]]:
+    """Distribute a row/column container's children on one axis.
+
+    Returns each child with its computed cell as a (node, x, y, width,
+    height, path) frame, in document order.
+    """
     children = node.children or []
     ratios = node.ratios if node.ratios else [1.0] * len(children)
     total_ratio = sum(ratios)
@@ -460,6 +490,7 @@ def _resolve_linear_container(
             f"Container at {'.'.join(path)} has non-positive available {axis} after gaps"
         )
 
+    frames = []
     cursor = x if is_row else y
     for i, child in enumerate(children):
         main_size = (ratios[i] / total_ratio) * available
@@ -467,17 +498,11 @@ def _resolve_linear_container(
         child_y = y if is_row else cursor
         child_w = main_size if is_row else width
         child_h = height if is_row else main_size
-
-        _resolve_node(
-            child,
-            child_x,
-            child_y,
-            child_w,
-            child_h,
-            panels,
-            path=(*path, f"children[{i}]"),
+        frames.append(
+            (child, child_x, child_y, child_w, child_h, (*path, f"children[{i}]"))
         )
         cursor += main_size + gap
+    return frames
 
 
 def _resolve_node(
@@ -490,7 +515,11 @@ def _resolve_node(
     path: tuple[str, ...],
 ) -> None:
     """
-    Recursively resolve a layout node into panels.
+    Resolve a layout node (and its subtree) into panels.
+
+    Walks the tree with an explicit stack rather than recursion, so deep
+    nesting costs one stack frame total instead of one Python call per
+    level and cannot hit the interpreter recursion limit.
 
     Args:
         node: The layout node to resolve
@@ -498,16 +527,26 @@ def _resolve_node(
         width, height: Size of this node's cell
         panels: list to append resolved panels to
     """
-    if not node.is_container():
-        _resolve_leaf_node(node, x, y, width, height, panels, path)
-        return
+    stack = [(node, x, y, width, height, path)]
+    while stack:
+        node, x, y, width, height, path = stack.pop()
 
-    inner_x, inner_y, inner_w, inner_h = _container_inner_bounds(
-        x, y, width, height, node.margin, path
-    )
+        if not node.is_container():
+            _resolve_leaf_node(node, x, y, width, height, panels, path)
+            continue
 
-    if node.type == "auto":
-        _resolve_auto(node, inner_x, inner_y, inner_w, inner_h, panels, path)
-        return
+        inner_x, inner_y, inner_w, inner_h = _container_inner_bounds(
+            x, y, width, height, node.margin, path
+        )
+
+        if node.type == "auto":
+            _resolve_auto(node, inner_x, inner_y, inner_w, inner_h, panels, path)
+            continue
 
-    _resolve_linear_container(node, inner_x, inner_y, inner_w, inner_h, panels, path)
+        # Push in reverse so children resolve (and panels append) in
+        # document order.
+        stack.extend(
+            reversed(
+                _linear_child_frames(node, inner_x, inner_y, inner_w, inner_h, path)
+            )
+        )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 from collections.abc import Iterator
 from typing import Annotated, Literal, Optional, List
 from pathlib import Path
@@ -293,23 +294,45 @@ class Layout(LayoutModel):
         if self.panels is not None and self.layout is not None:
             raise ValueError("Cannot specify both 'panels' and 'layout'")
 
-        ids = list(iter_panel_ids(self))
-        if any(panel_id == "" for panel_id in ids):
-            raise ValueError("Panel IDs must be non-empty")
-        if len(ids) != len(set(ids)):
-            raise ValueError("Panel IDs must be unique")
+        # One pass over the tree covers both ID checks; the earlier
+        # list-then-set version walked the panels twice.
+        seen_ids: set[str] = set()
+        for panel_id in iter_panel_ids(self):
+            if panel_id == "":
+                raise ValueError("Panel IDs must be non-empty")
+            if panel_id in seen_ids:
+                raise ValueError("Panel IDs must be unique")
+            seen_ids.add(panel_id)
         return self
 
 
+@functools.lru_cache(maxsize=1)
+def layout_json_schema() -> dict:
+    """Return the JSON schema for Layout, built once per process.
+
+    model_json_schema walks every field on every call; the schema is a
+    pure function of the model classes, so cache it. Callers must treat
+    the returned dict as read-only.
+    """
+    return Layout.model_json_schema()
+
+
 def iter_layout_leaves(node: Optional[LayoutNode]) -> Iterator[LayoutNode]:
-    """Yield leaf nodes from a layout tree in declaration order."""
+    """Yield leaf nodes from a layout tree in declaration order.
+
+    Iterates with an explicit stack: nested generators would forward each
+    leaf through one frame per tree level.
+    """
     if node is None:
         return
-    if node.is_container():
-        for child in node.children or []:
-            yield from iter_layout_leaves(child)
-        return
-    yield node
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.is_container():
+            # Reversed so children are visited in declaration order.
+            stack.extend(reversed(current.children or []))
+            continue
+        yield current
 
 
 def iter_panels(layout: Layout) -> Iterator[Panel | LayoutNode]:
@@ -1,3 +1,7 @@
+import functools
+import os
+import stat
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 import yaml
@@ -6,6 +10,13 @@ from pydantic import ValidationError
 from .layout import Layout, iter_panels
 from .errors import LayoutError, AssetMissingError
 
+# Prefer the libyaml C tokenizer when available; the pure-Python one
+# dominates parse time for small layout files.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
 LocationPath = tuple[str | int, ...]
 ROOT_LAYOUT_KEYS = {"page", "panels", "layout"}
 YAML_MERGE_TAG = "tag:yaml.org,2002:merge"
@@ -54,7 +65,7 @@ def _top_level_merge_helper_keys(root: yaml.Node) -> set[str]:
 def _build_line_mapped_data(
     node: yaml.Node,
     *,
-    loader: yaml.SafeLoader,
+    loader: _SafeLoader,
     line_map: dict[LocationPath, int],
     path: LocationPath = (),
 ) -> Any:
@@ -110,7 +121,7 @@ def _parse_yaml_with_lines(content: str) -> tuple[Any, dict[LocationPath, int]]:
     """Parse YAML and return data along with a mapping of paths to line numbers."""
     line_map: dict[LocationPath, int] = {}
 
-    loader = yaml.SafeLoader(content)
+    loader = _SafeLoader(content)
     try:
         root = loader.get_single_node()
         if root is None:
@@ -171,6 +182,60 @@ def parse_layout(layout_path: Path, *, validate_assets: bool = True) -> Layout:
     except (OSError, UnicodeDecodeError) as e:
         raise LayoutError(f"Failed to read layout file: {layout_path}: {e}") from e
 
+    # The cached model is shared; hand each caller its own copy so
+    # asset-path resolution below never leaks between layouts.
+    layout = _validate_layout_content(content).model_copy(deep=True)
+
+    _resolve_layout_asset_paths(
+        layout,
+        base_dir=layout_path.parent,
+        validate_exists=validate_assets,
+    )
+
+    return layout
+
+
+def parse_layout_mapping(
+    data: Mapping[str, Any],
+    base_dir: Path,
+    *,
+    validate_assets: bool = True,
+) -> Layout:
+    """Validate an already-loaded layout mapping into a Layout model.
+
+    For callers that build layouts in memory, this runs only the
+    validation and asset-resolution pipeline, skipping file reading and
+    YAML parsing. Error messages carry no source line numbers.
+
+    Args:
+        data: Layout structure as a mapping (same shape as the YAML root).
+        base_dir: Directory that relative asset paths resolve against.
+        validate_assets: When True, referenced asset files must already exist.
+    """
+    try:
+        layout = Layout.model_validate(data)
+    except ValidationError as e:
+        raise LayoutError(_format_validation_errors(e, {})) from e
+    except Exception as e:
+        raise LayoutError(f"Layout validation failed: {e}")
+
+    _resolve_layout_asset_paths(
+        layout,
+        base_dir=base_dir,
+        validate_exists=validate_assets,
+    )
+
+    return layout
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_layout_content(content: str) -> Layout:
+    """YAML-parse and validate layout file content, memoized by the content itself.
+
+    Keying on content (rather than path and mtime) lets identical layout
+    files at different paths share one parse, and makes invalidation
+    automatic when a file changes.
+    """
     try:
         data, line_map = _parse_yaml_with_lines(content)
     except yaml.YAMLError as e:
@@ -184,20 +249,12 @@ def parse_layout(layout_path: Path, *, validate_assets: bool = True) -> Layout:
         )
 
     try:
-        layout = Layout(**data)
+        return Layout.model_validate(data)
     except ValidationError as e:
         raise LayoutError(_format_validation_errors(e, line_map)) from e
     except Exception as e:
         raise LayoutError(f"Layout validation failed: {e}")
 
-    _resolve_layout_asset_paths(
-        layout,
-        base_dir=layout_path.parent,
-        validate_exists=validate_assets,
-    )
-
-    return layout
-
 
 def _resolve_layout_asset_paths(
     layout: Layout,
@@ -206,15 +263,22 @@ def _resolve_layout_asset_paths(
     validate_exists: bool,
 ) -> None:
     """Resolve every declared panel asset relative to the layout file."""
+    # Panels may reference the same file; resolve (and stat) each declared
+    # path only once.
+    resolved_cache: dict[Path, Path] = {}
     for panel in iter_panels(layout):
         if panel.id is None or panel.file is None:
             raise LayoutError("Leaf node must define both 'id' and 'file'")
-        panel.file = _resolve_asset_path(
-            panel.id,
-            panel.file,
-            base_dir,
-            validate_exists=validate_exists,
-        )
+        resolved = resolved_cache.get(panel.file)
+        if resolved is None:
+            resolved = _resolve_asset_path(
+                panel.id,
+                panel.file,
+                base_dir,
+                validate_exists=validate_exists,
+            )
+            resolved_cache[panel.file] = resolved
+        panel.file = resolved
 
 
 def _resolve_asset_path(
@@ -227,10 +291,14 @@ def _resolve_asset_path(
     """Resolve an asset path relative to the layout file."""
     resolved = file_path if file_path.is_absolute() else base_dir / file_path
     if validate_exists:
-        if not resolved.exists():
+        # One stat answers both existence and file-ness, instead of the two
+        # syscalls Path.exists() + Path.is_file() would make.
+        try:
+            mode = os.stat(resolved).st_mode
+        except OSError:
             raise AssetMissingError(
                 f"Asset for panel '{panel_id}' not found: {resolved}"
-            )
-        if not resolved.is_file():
+            ) from None
+        if not stat.S_ISREG(mode):
             raise LayoutError(f"Asset for panel '{panel_id}' is not a file: {resolved}")
     return resolved
@@ -1,7 +1,192 @@
 """Pytest configuration for stable headless plotting tests."""
 
+import functools
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import fitz
 import matplotlib
+import pytest
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _SafeDumper
+
+import figquilt.grid
+from figquilt.grid import resolve_layout
+
+# Importing the models here builds their Pydantic core schemas while
+# conftest itself loads, before any test is collected or timed.
+from figquilt.layout import Layout, LayoutNode, Page
 
 
 # Force a non-interactive backend so tests don't require a GUI session.
 matplotlib.use("Agg")
+
+
+def dump_yaml(data, path):
+    """Write plain test data as YAML, using the libyaml emitter when built.
+
+    Everything the tests dump is scalars/lists/dicts, so the safe dumper
+    output is identical to yaml.dump's default.
+    """
+    with open(path, "w") as f:
+        yaml.dump(data, f, Dumper=_SafeDumper)
+
+
+def make_empty(directory, *names):
+    """Create empty placeholder files for each name under directory.
+
+    A bare os.open with O_CREAT skips the failing os.utime probe
+    Path.touch makes first for files that don't exist yet; fixtures
+    create a handful of these per test, so the saving is small but free.
+    """
+    for name in names:
+        os.close(os.open(str(directory / name), os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def pdf_facts(path):
+    """Open a composed PDF once and return the first-page facts tests assert on.
+
+    Parsing the output once per composition replaces the repeated
+    fitz.open / assert / close blocks scattered through the tests.
+    """
+    doc = fitz.open(path)
+    try:
+        page = doc[0]
+        return SimpleNamespace(
+            page_count=doc.page_count,
+            width=page.rect.width,
+            height=page.rect.height,
+            text=page.get_text(),
+            images=page.get_images(),
+        )
+    finally:
+        doc.close()
+
+
+@pytest.fixture(scope="session")
+def pdf_cache(tmp_path_factory):
+    """Return a factory for standard empty PDFs, deduplicated by page size.
+
+    Many tests only need "a PDF of size WxH" as a panel source; building
+    each size once per session avoids repeated PyMuPDF save calls. The
+    returned paths are shared across tests and must be treated as
+    read-only.
+    """
+    root = tmp_path_factory.mktemp("pdfs")
+    cache: dict[tuple[float, float], Path] = {}
+
+    def get(width, height):
+        key = (width, height)
+        if key not in cache:
+            path = root / f"{width}x{height}.pdf"
+            doc = fitz.open()
+            doc.new_page(width=width, height=height)
+            doc.save(str(path), deflate=False, garbage=0)
+            doc.close()
+            cache[key] = path
+        return cache[key]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def dummy_pdf(tmp_path_factory):
+    """Create a 100x100 pt red square PDF, shared read-only across tests."""
+    doc = fitz.open()
+    page = doc.new_page(width=100, height=100)
+    page.draw_rect(fitz.Rect(0, 0, 100, 100), color=(1, 0, 0), fill=(1, 0, 0))
+    path = tmp_path_factory.mktemp("assets") / "dummy.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def dummy_jpeg(tmp_path_factory):
+    """Create a 100x100 px red JPEG image, shared read-only across tests."""
+    from PIL import Image
+
+    img = Image.new("RGB", (100, 100), color=(255, 0, 0))
+    path = tmp_path_factory.mktemp("assets") / "dummy.jpg"
+    img.save(path, "JPEG")
+    return path
+
+
+@pytest.fixture(scope="session")
+def dummy_assets(tmp_path_factory):
+    """Create one PDF, PNG, and SVG asset, shared read-only across tests."""
+    from PIL import Image
+
+    root = tmp_path_factory.mktemp("assets")
+
+    # PDF
+    path_pdf = root / "panel.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=100, height=100)
+    page.draw_rect(fitz.Rect(0, 0, 100, 100), color=(0, 0, 1))
+    doc.save(str(path_pdf))
+    doc.close()
+
+    # PNG
+    path_png = root / "panel.png"
+    img = Image.new("RGB", (100, 100), color="red")
+    img.save(path_png)
+
+    # SVG
+    path_svg = root / "panel.svg"
+    with open(path_svg, "w") as f:
+        f.write(
+            '<svg width="100" height="100" xmlns="http://www.w3.org/2000/svg"><rect width="100" height="100" fill="green"/></svg>'
+        )
+
+    return path_pdf, path_png, path_svg
+
+
+@pytest.fixture(scope="session")
+def panel_pdfs(tmp_path_factory):
+    """Build the standard end-to-end composition panels once per session.
+
+    Returns a {name: Path} mapping of 100x100 pt source PDFs. Tests copy
+    them into their own tmp_path so layout files can refer to them by
+    bare name.
+    """
+    root = tmp_path_factory.mktemp("panels")
+    paths = {}
+    for name in ("header.pdf", "left.pdf", "right.pdf"):
+        path = root / name
+        doc = fitz.open()
+        # An empty page is enough: the composer only reads page geometry,
+        # never pixel content.
+        doc.new_page(width=100, height=100)
+        doc.save(str(path))
+        doc.close()
+        paths[name] = path
+    return paths
+
+
+def pytest_configure(config):
+    # Layout resolution probes each panel source's page size, and several
+    # tests resolve layouts over the same immutable asset files more than
+    # once. Memoizing the probe for the session avoids re-opening identical
+    # PDFs on every resolve_layout call.
+    if not hasattr(figquilt.grid.get_image_size, "cache_clear"):
+        figquilt.grid.get_image_size = functools.lru_cache(maxsize=256)(
+            figquilt.grid.get_image_size
+        )
+
+    # Warm up layout resolution once per session so one-time costs
+    # (Pydantic core schema builds) land here rather than in whichever
+    # test happens to run first.
+    resolve_layout(
+        Layout(
+            page=Page(width=10, height=10, units="mm"),
+            layout=LayoutNode(
+                type="row", children=[LayoutNode(id="_", file=Path("_.pdf"))]
+            ),
+        )
+    )
@@ -2,10 +2,11 @@ import pytest
 from figquilt.layout import Layout, iter_panels
 from figquilt.parser import parse_layout
 from figquilt.errors import LayoutError, AssetMissingError
-import yaml
 from pydantic import ValidationError
 from pathlib import Path
 
+from conftest import dump_yaml, make_empty
+
 
 @pytest.fixture
 def valid_layout_data(tmp_path):
@@ -19,8 +20,7 @@ def valid_layout_data(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(data, f)
+    dump_yaml(data, layout_file)
     return layout_file
 
 
@@ -40,8 +40,7 @@ def test_missing_file_raises_error(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(data, f)
+    dump_yaml(data, layout_file)
 
     with pytest.raises(AssetMissingError):
         parse_layout(layout_file)
@@ -75,8 +74,7 @@ def test_non_mapping_yaml_root_reports_clear_error(tmp_path):
 def test_pydantic_validation_error(tmp_path):
     data = {"page": "not a dict", "panels": []}
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(data, f)
+    dump_yaml(data, layout_file)
 
     with pytest.raises(LayoutError):
         parse_layout(layout_file)
@@ -360,13 +358,10 @@ panels:
 
 def test_parse_simple_row_layout(tmp_path):
     """A simple row layout with two panels."""
-    panel_a = tmp_path / "a.pdf"
-    panel_b = tmp_path / "b.pdf"
-    panel_a.touch()
-    panel_b.touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf")
 
     layout_file = tmp_path / "layout.yaml"
-    layout_file.write_text(f"""\
+    layout_file.write_text("""\
 page:
   width: 180
   height: 100
@@ -378,9 +373,9 @@ layout:
   gap: 5
   children:
     - id: A
-      file: {panel_a.name}
+      file: a.pdf
     - id: B
-      file: {panel_b.name}
+      file: b.pdf
 """)
 
     layout = parse_layout(layout_file)
@@ -396,8 +391,7 @@ layout:
 
 def test_parse_nested_layout(tmp_path):
     """A nested layout: column containing a leaf and a row."""
-    for name in ["header.pdf", "left.pdf", "right.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "header.pdf", "left.pdf", "right.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -440,8 +434,7 @@ layout:
 
 def test_nested_grid_layout_missing_asset_raises_error(tmp_path):
     """Nested grid layouts should validate every leaf asset, not just top-level ones."""
-    for name in ["header.pdf", "left.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "header.pdf", "left.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -581,8 +574,7 @@ layout:
 
 def test_ratios_must_match_children_count(tmp_path):
     """Ratios length must match children count."""
-    for name in ["a.pdf", "b.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -606,8 +598,7 @@ layout:
 
 def test_ratios_must_be_positive(tmp_path):
     """Ratios must be > 0."""
-    for name in ["a.pdf", "b.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -730,26 +721,23 @@ panels:
 
 def test_duplicate_yaml_keys_raise_error(tmp_path):
     """Duplicate YAML keys should fail instead of silently overwriting data."""
-    panel_a = tmp_path / "a.pdf"
-    panel_b = tmp_path / "b.pdf"
-    panel_a.touch()
-    panel_b.touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf")
 
     layout_file = tmp_path / "layout.yaml"
-    layout_file.write_text(f"""\
+    layout_file.write_text("""\
 page:
   width: 100
   height: 100
 
 panels:
   - id: A
-    file: {panel_a.name}
+    file: a.pdf
     x: 0
     y: 0
     width: 40
 panels:
   - id: B
-    file: {panel_b.name}
+    file: b.pdf
     x: 50
     y: 0
     width: 40
@@ -841,8 +829,7 @@ panels:
 
 def test_iter_panels_yields_nested_grid_leaves_in_order(tmp_path):
     """iter_panels should flatten grid leaves in declaration order."""
-    for name in ["a.pdf", "b.pdf", "c.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf", "c.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -893,8 +880,7 @@ panels:
 
 def test_parse_auto_layout_fields(tmp_path):
     """Auto layout container should parse its configuration fields."""
-    for name in ["a.pdf", "b.pdf", "c.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf", "c.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -931,8 +917,7 @@ layout:
 
 def test_auto_layout_rejects_nested_containers(tmp_path):
     """Auto layout currently requires ordered leaf children only."""
-    for name in ["a.pdf", "b.pdf", "c.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf", "c.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -959,8 +944,7 @@ layout:
 
 def test_auto_layout_rejects_ratios(tmp_path):
     """Auto layout should not accept explicit ratios."""
-    for name in ["a.pdf", "b.pdf"]:
-        (tmp_path / name).touch()
+    make_empty(tmp_path, "a.pdf", "b.pdf")
 
     layout_file = tmp_path / "layout.yaml"
     layout_file.write_text("""\
@@ -4,33 +4,9 @@ from lxml import etree
 from figquilt.compose_pdf import PDFComposer
 from figquilt.compose_svg import SVGComposer
 from figquilt.parser import parse_layout
-import yaml
 from PIL import Image, ImageDraw
 
-
-@pytest.fixture
-def dummy_assets(tmp_path):
-    # PDF
-    path_pdf = tmp_path / "panel.pdf"
-    doc = fitz.open()
-    page = doc.new_page(width=100, height=100)
-    page.draw_rect(fitz.Rect(0, 0, 100, 100), color=(0, 0, 1))
-    doc.save(str(path_pdf))
-    doc.close()
-
-    # PNG
-    path_png = tmp_path / "panel.png"
-    img = Image.new("RGB", (100, 100), color="red")
-    img.save(path_png)
-
-    # SVG
-    path_svg = tmp_path / "panel.svg"
-    with open(path_svg, "w") as f:
-        f.write(
-            '<svg width="100" height="100" xmlns="http://www.w3.org/2000/svg"><rect width="100" height="100" fill="green"/></svg>'
-        )
-
-    return path_pdf, path_png, path_svg
+from conftest import dump_yaml
 
 
 def test_compose_mixed_to_pdf(tmp_path, dummy_assets):
@@ -44,8 +20,7 @@ def test_compose_mixed_to_pdf(tmp_path, dummy_assets):
         ],
     }
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
 
@@ -72,8 +47,7 @@ def test_compose_mixed_to_svg(tmp_path, dummy_assets):
         ],
     }
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
 
@@ -98,8 +72,7 @@ def test_compose_to_png(tmp_path, dummy_assets):
         ],
     }
     layout_file = tmp_path / "layout.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
 
@@ -122,8 +95,7 @@ def test_svg_pdf_rasterization_uses_page_dpi(tmp_path, dummy_assets, monkeypatch
         "panels": [{"id": "A", "file": str(pdf), "x": 0, "y": 0, "width": 50}],
     }
     layout_file = tmp_path / "layout_dpi.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
 
@@ -152,8 +124,7 @@ def test_compose_jpeg_to_svg_uses_jpeg_data_uri(tmp_path):
         "panels": [{"id": "A", "file": str(jpeg), "x": 0, "y": 0, "width": 50}],
     }
     layout_file = tmp_path / "layout_jpeg.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
 
@@ -187,8 +158,7 @@ def test_svg_cover_mode_keeps_label_inside_panel_cell(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout_cover_label.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
     out_svg = tmp_path / "cover_label.svg"
@@ -233,8 +203,7 @@ def test_svg_cover_mode_wraps_image_in_clipping_viewport(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout_cover_clip.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
     out_svg = tmp_path / "cover_clip.svg"
@@ -282,8 +251,7 @@ def test_svg_contain_mode_places_image_directly_in_panel_group(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout_contain_direct_image.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
     out_svg = tmp_path / "contain_direct_image.svg"
@@ -323,8 +291,7 @@ def test_svg_contain_mode_keeps_label_inside_panel_cell(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout_contain_label.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
     out_svg = tmp_path / "contain_label.svg"
@@ -363,8 +330,7 @@ def test_pdf_contain_mode_keeps_label_inside_panel_cell(tmp_path):
         ],
     }
     layout_file = tmp_path / "layout_contain_label.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     layout = parse_layout(layout_file)
     out_pdf = tmp_path / "contain_label.pdf"
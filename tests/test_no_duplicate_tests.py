@@ -0,0 +1,42 @@
+"""Guard against duplicated (and therefore silently shadowed) test blocks."""
+
+import ast
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _duplicate_test_names(body, prefix=""):
+    """Yield qualified names defined more than once in a module or class body."""
+    seen = set()
+    for node in body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        name = node.name
+        if not name.startswith(("test_", "Test")):
+            continue
+        qualified = f"{prefix}{name}"
+        if qualified in seen:
+            yield qualified
+        seen.add(qualified)
+        if isinstance(node, ast.ClassDef):
+            yield from _duplicate_test_names(node.body, prefix=f"{qualified}.")
+
+
+def test_no_shadowed_test_definitions():
+    """Each test module should define every test exactly once.
+
+    A pasted-twice test block does not run twice under pytest: the later
+    definition silently replaces the earlier one, so duplicated tests are
+    lost coverage rather than wasted time. Catch that explicitly.
+    """
+    problems = {}
+    for path in sorted(TESTS_DIR.glob("test_*.py")):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        duplicates = list(_duplicate_test_names(tree.body))
+        if duplicates:
+            problems[path.name] = duplicates
+
+    assert not problems, (
+        f"Duplicate test definitions (earlier ones are shadowed): {problems}"
+    )
@@ -3,19 +3,9 @@ import fitz
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from figquilt.compose_pdf import PDFComposer
-import yaml
+from figquilt.parser import parse_layout_mapping
 
-
-@pytest.fixture
-def dummy_pdf(tmp_path):
-    # Create a 100x100 pt red square PDF
-    doc = fitz.open()
-    page = doc.new_page(width=100, height=100)
-    page.draw_rect(fitz.Rect(0, 0, 100, 100), color=(1, 0, 0), fill=(1, 0, 0))
-    path = tmp_path / "dummy.pdf"
-    doc.save(str(path))
-    doc.close()
-    return path
+from conftest import dump_yaml, pdf_facts
 
 
 def test_compose_pdf_simple(tmp_path, dummy_pdf):
@@ -26,8 +16,7 @@ def test_compose_pdf_simple(tmp_path, dummy_pdf):
     }
 
     layout_file = tmp_path / "layout_pdf.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
+    dump_yaml(layout_data, layout_file)
 
     # We need to load layout objects (usually via parser, but testing composer directly here)
     from figquilt.parser import parse_layout
@@ -41,16 +30,13 @@ def test_compose_pdf_simple(tmp_path, dummy_pdf):
     assert output_pdf.exists()
 
     # Validation
-    doc = fitz.open(output_pdf)
-    assert doc.page_count == 1
-    page = doc[0]
+    facts = pdf_facts(output_pdf)
+    assert facts.page_count == 1
     # Page size should be 100mm * 72/25.4 ~= 283.46 pts
-    assert abs(page.rect.width - (100 * 72 / 25.4)) < 0.1
+    assert abs(facts.width - (100 * 72 / 25.4)) < 0.1
 
     # Check if text "A" exists (default label)
-    text = page.get_text()
-    assert "A" in text
-    doc.close()
+    assert "A" in facts.text
 
 
 def test_compose_pdf_inches(tmp_path, dummy_pdf):
@@ -60,13 +46,7 @@ def test_compose_pdf_inches(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 4}],
     }
 
-    layout_file = tmp_path / "layout_inches.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     output_pdf = tmp_path / "output_inches.pdf"
     composer = PDFComposer(layout)
@@ -74,12 +54,10 @@ def test_compose_pdf_inches(tmp_path, dummy_pdf):
 
     assert output_pdf.exists()
 
-    doc = fitz.open(output_pdf)
-    page = doc[0]
+    facts = pdf_facts(output_pdf)
     # 8 inches = 576 pts, 6 inches = 432 pts
-    assert abs(page.rect.width - 576) < 0.1
-    assert abs(page.rect.height - 432) < 0.1
-    doc.close()
+    assert abs(facts.width - 576) < 0.1
+    assert abs(facts.height - 432) < 0.1
 
 
 def test_compose_pdf_pt(tmp_path, dummy_pdf):
@@ -89,13 +67,7 @@ def test_compose_pdf_pt(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 10, "y": 10, "width": 100}],
     }
 
-    layout_file = tmp_path / "layout_pt.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     output_pdf = tmp_path / "output_pt.pdf"
     composer = PDFComposer(layout)
@@ -103,12 +75,10 @@ def test_compose_pdf_pt(tmp_path, dummy_pdf):
 
     assert output_pdf.exists()
 
-    doc = fitz.open(output_pdf)
-    page = doc[0]
+    facts = pdf_facts(output_pdf)
     # 400 pt, 300 pt directly
-    assert abs(page.rect.width - 400) < 0.1
-    assert abs(page.rect.height - 300) < 0.1
-    doc.close()
+    assert abs(facts.width - 400) < 0.1
+    assert abs(facts.height - 300) < 0.1
 
 
 def test_compose_pdf_with_margin(tmp_path, dummy_pdf):
@@ -119,13 +89,7 @@ def test_compose_pdf_with_margin(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 30}],
     }
 
-    layout_file = tmp_path / "layout_margin.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     # Verify margin was parsed
     assert layout.page.margin == 10
@@ -136,10 +100,9 @@ def test_compose_pdf_with_margin(tmp_path, dummy_pdf):
 
     assert output_pdf.exists()
 
-    # The panel should be offset by margin (10mm = 28.35pt)
-    doc = fitz.open(output_pdf)
-    # Extract images/forms to check position - or just verify doc renders
-    doc.close()
+    # The panel should be offset by margin (10mm = 28.35pt); just verify
+    # the output parses as a one-page document
+    assert pdf_facts(output_pdf).page_count == 1
 
 
 def test_pdf_label_style_font_family_is_applied(tmp_path, dummy_pdf):
@@ -158,13 +121,7 @@ def test_pdf_label_style_font_family_is_applied(tmp_path, dummy_pdf):
         ],
     }
 
-    layout_file = tmp_path / "layout_label_font.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     output_pdf = tmp_path / "output_label_font.pdf"
     PDFComposer(layout).compose(output_pdf)
@@ -313,13 +270,7 @@ def testparse_color_valid_hex(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 50}],
     }
 
-    layout_file = tmp_path / "layout_color.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
     composer = PDFComposer(layout)
 
     # Test the internal parse_color method
@@ -340,13 +291,7 @@ def testparse_color_invalid_hex(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 50}],
     }
 
-    layout_file = tmp_path / "layout_nocolor.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
     composer = PDFComposer(layout)
 
     # Too short hex string
@@ -366,13 +311,7 @@ def testparse_color_shorthand_hex(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 50}],
     }
 
-    layout_file = tmp_path / "layout_shorthand.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
     composer = PDFComposer(layout)
 
     assert composer.parse_color("#fff") == (1.0, 1.0, 1.0)
@@ -386,13 +325,7 @@ def testparse_color_named_colors(tmp_path, dummy_pdf):
         "panels": [{"id": "A", "file": str(dummy_pdf), "x": 0, "y": 0, "width": 50}],
     }
 
-    layout_file = tmp_path / "layout_named.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
     composer = PDFComposer(layout)
 
     # Named colors should work via PIL
@@ -406,17 +339,6 @@ def testparse_color_named_colors(tmp_path, dummy_pdf):
     assert composer.parse_color("notavalidcolor") is None
 
 
-@pytest.fixture
-def dummy_jpeg(tmp_path):
-    """Create a 100x100 px red JPEG image."""
-    from PIL import Image
-
-    img = Image.new("RGB", (100, 100), color=(255, 0, 0))
-    path = tmp_path / "dummy.jpg"
-    img.save(path, "JPEG")
-    return path
-
-
 def test_compose_pdf_with_jpeg_input(tmp_path, dummy_jpeg):
     """Test that JPEG images can be embedded in PDF output."""
     layout_data = {
@@ -424,13 +346,7 @@ def test_compose_pdf_with_jpeg_input(tmp_path, dummy_jpeg):
         "panels": [{"id": "A", "file": str(dummy_jpeg), "x": 0, "y": 0, "width": 50}],
     }
 
-    layout_file = tmp_path / "layout_jpeg.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     output_pdf = tmp_path / "output_jpeg.pdf"
     composer = PDFComposer(layout)
@@ -439,22 +355,17 @@ def test_compose_pdf_with_jpeg_input(tmp_path, dummy_jpeg):
     assert output_pdf.exists()
 
     # Validate the PDF contains exactly 1 page with expected dimensions
-    doc = fitz.open(output_pdf)
-    assert doc.page_count == 1
-    page = doc[0]
+    facts = pdf_facts(output_pdf)
+    assert facts.page_count == 1
 
     # Page size should be 100mm * 72/25.4 ~= 283.46 pts
-    assert abs(page.rect.width - (100 * 72 / 25.4)) < 0.1
+    assert abs(facts.width - (100 * 72 / 25.4)) < 0.1
 
     # Check if text "A" exists (default label)
-    text = page.get_text()
-    assert "A" in text
+    assert "A" in facts.text
 
     # Verify the page has image content by checking for XObject references
-    xobjects = page.get_images()
-    assert len(xobjects) >= 1, "JPEG image should be embedded in the PDF"
-
-    doc.close()
+    assert len(facts.images) >= 1, "JPEG image should be embedded in the PDF"
 
 
 def test_compose_pdf_with_jpeg_fit_modes(tmp_path, dummy_jpeg):
@@ -474,13 +385,7 @@ def test_compose_pdf_with_jpeg_fit_modes(tmp_path, dummy_jpeg):
         ],
     }
 
-    layout_file = tmp_path / "layout_jpeg_fit.yaml"
-    with open(layout_file, "w") as f:
-        yaml.dump(layout_data, f)
-
-    from figquilt.parser import parse_layout
-
-    layout = parse_layout(layout_file)
+    layout = parse_layout_mapping(layout_data, tmp_path)
 
     output_pdf = tmp_path / "output_jpeg_fit.pdf"
     composer = PDFComposer(layout)
@@ -488,6 +393,4 @@ def test_compose_pdf_with_jpeg_fit_modes(tmp_path, dummy_jpeg):
 
     assert output_pdf.exists()
 
-    doc = fitz.open(output_pdf)
-    assert doc.page_count == 1
-    doc.close()
+    assert pdf_facts(output_pdf).page_count == 1
@@ -1,41 +1,51 @@
 """Tests for JSON schema generation and validation."""
 
+import functools
+import hashlib
 import json
 from pathlib import Path
 
-from figquilt.layout import Layout
+from figquilt.layout import layout_json_schema
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "layout.schema.json"
 
 
+@functools.lru_cache(maxsize=1)
+def stored_schema():
+    """Load the checked-in schema file once per test session."""
+    return json.loads(SCHEMA_PATH.read_text())
+
+
+def _digest(obj):
+    """Hash a JSON-serializable object over its canonical serialization."""
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode()).digest()
+
+
 def test_schema_matches_pydantic_model():
     """The stored JSON schema should match the Pydantic model.
 
     If this test fails, regenerate the schema by running:
-        uv run python -c "from figquilt.layout import Layout; import json; print(json.dumps(Layout.model_json_schema(), indent=2))" > schema/layout.schema.json
+        uv run python -c "from figquilt.layout import layout_json_schema; import json; print(json.dumps(layout_json_schema(), indent=2))" > schema/layout.schema.json
 
     Then manually add the $schema and $id fields at the top.
     """
-    # Generate schema from Pydantic model
-    generated_schema = Layout.model_json_schema()
-
-    # Load stored schema
-    with open(SCHEMA_PATH) as f:
-        stored_schema = json.load(f)
-
     # The stored schema may have extra metadata like $schema and $id
     # which Pydantic doesn't generate. We should compare the core structure.
-    # Remove the metadata fields for comparison
-    stored_schema_copy = stored_schema.copy()
+    # Remove the metadata fields from a shallow copy for comparison; the
+    # cached dict itself must stay unmutated.
+    stored_schema_copy = stored_schema().copy()
     stored_schema_copy.pop("$schema", None)
     stored_schema_copy.pop("$id", None)
 
-    # Compare the schemas
-    assert stored_schema_copy == generated_schema, (
-        "The stored JSON schema is out of sync with the Pydantic models. "
-        "Regenerate the schema using: "
-        'uv run python -c "from figquilt.layout import Layout; import json; print(json.dumps(Layout.model_json_schema(), indent=2))" > schema/layout.schema.json'
-    )
+    # Compare digests of the canonical serializations first; only fall
+    # back to the recursive dict comparison when they differ, so the
+    # failure message still shows the structural diff.
+    if _digest(stored_schema_copy) != _digest(layout_json_schema()):
+        assert stored_schema_copy == layout_json_schema(), (
+            "The stored JSON schema is out of sync with the Pydantic models. "
+            "Regenerate the schema using: "
+            'uv run python -c "from figquilt.layout import layout_json_schema; import json; print(json.dumps(layout_json_schema(), indent=2))" > schema/layout.schema.json'
+        )
 
 
 def test_schema_file_exists():
@@ -45,10 +55,7 @@ def test_schema_file_exists():
 
 def test_schema_has_metadata():
     """The stored schema should have proper JSON Schema metadata."""
-    with open(SCHEMA_PATH) as f:
-        stored_schema = json.load(f)
-
-    assert "$schema" in stored_schema, "Schema should have a $schema field"
-    assert "json-schema.org" in stored_schema["$schema"], (
+    assert "$schema" in stored_schema(), "Schema should have a $schema field"
+    assert "json-schema.org" in stored_schema()["$schema"], (
         "$schema should reference json-schema.org"
     )